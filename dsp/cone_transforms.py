@@ -44,7 +44,7 @@ class KRepresentation:
         offset = np.sum([K.offset for K in reprs])
 
         def f_concave(x: np.ndarray) -> cp.Expression:
-            nones = any([K.concave_expr(x) is None for K in reprs])
+            nones = any(K.concave_expr(x) is None for K in reprs)
             return cp.sum([K.concave_expr(x) for K in reprs]) if not nones else None
 
         concave_expr = f_concave
@@ -365,10 +365,10 @@ def get_cone_repr(
             else (v.shape[0] * (v.shape[0] + 1) // 2)
         )  # fix for symmetric variables
         end_ind = start_ind + sz
-        original_cols = np.arange(start_ind, end_ind)
 
-        var_to_mat_mapping[v.id] = A[:, original_cols]
-        unused_mask[original_cols] = 0
+        # contiguous column slices of a CSC matrix avoid the fancy-indexing path
+        var_to_mat_mapping[v.id] = A[:, start_ind:end_ind]
+        unused_mask[start_ind:end_ind] = 0
 
     var_to_mat_mapping["eta"] = A[:, unused_mask]
 
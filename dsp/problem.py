@@ -269,7 +269,7 @@ def is_dsp(obj: cp.Problem | SaddlePointProblem | cp.Expression) -> bool:
         return obj.is_dsp()
     elif isinstance(obj, cp.Problem):
         all_SE_atoms = get_problem_SE_atoms(obj)
-        return obj.is_dcp() and all([atom.is_dsp() for atom in all_SE_atoms])
+        return obj.is_dcp() and all(atom.is_dsp() for atom in all_SE_atoms)
     elif isinstance(obj, cp.Expression):
         return is_dsp_expr(obj)
     else:
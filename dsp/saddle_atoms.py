@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 
 import cvxpy as cp
 import numpy as np
+import scipy.sparse as sp
 from cvxpy.atoms.atom import Atom
 from cvxpy.constraints import ExpCone
 from cvxpy.utilities.sign import mul_sign
@@ -24,6 +25,10 @@ from dsp.utils import np_vec
 
 
 class SaddleAtom(Atom, ABC):
+    def __init__(self, *args: cp.Expression) -> None:
+        self._affine_canon_cache: dict[tuple, tuple[sp.csr_matrix, np.ndarray]] = {}
+        super().__init__(*args)
+
     def get_K_repr(self, local_to_glob: LocalToGlob, switched: bool = False) -> KRepresentation:
         if not self.is_dsp():
             raise DSPError(str(self) + " is not a DSP expression.")
@@ -34,6 +39,29 @@ class SaddleAtom(Atom, ABC):
     def _get_K_repr(self, local_to_glob: LocalToGlob, switched: bool) -> KRepresentation:
         raise NotImplementedError
 
+    def _affine_to_canon_T(
+        self, expr: cp.Expression, local_to_glob: LocalToGlob, switched: bool
+    ) -> tuple[sp.csr_matrix, np.ndarray]:
+        """
+        Memoized affine_to_canon, returning B.T instead of B since that is what the
+        K representations use. The atom's arguments are fixed after construction,
+        so B and c only depend on the number of columns and on where the variables of
+        expr are placed in them, which lets LocalToGlob instances with the same layout
+        share an entry. Parameter values are baked into B and c, so expressions with
+        parameters are not memoized.
+        """
+        if expr.parameters():
+            B, c = affine_to_canon(expr, local_to_glob, switched)
+            return B.T, c
+
+        cols = local_to_glob.y_size if not switched else local_to_glob.x_size
+        layout = tuple(local_to_glob.var_to_glob[v.id] for v in expr.variables())
+        key = (expr.id, cols, layout)
+        if key not in self._affine_canon_cache:
+            B, c = affine_to_canon(expr, local_to_glob, switched)
+            self._affine_canon_cache[key] = (B.T, c)
+        return self._affine_canon_cache[key]
+
     @abstractmethod
     def convex_variables(self) -> list[cp.Variable]:
         raise NotImplementedError
@@ -59,7 +87,7 @@ class SaddleAtom(Atom, ABC):
         raise NotImplementedError
 
     def numeric(self, values: list[np.ndarray | None]) -> np.ndarray | None:
-        if any([v is None for v in values]):
+        if any(v is None for v in values):
             return None
         return self._numeric(values)
 
@@ -98,7 +126,9 @@ class saddle_inner(SaddleAtom):
         assert isinstance(Gy, cp.Expression)
 
         self.bilinear = Fx.is_affine() and Gy.is_affine()
-        if (not self.bilinear) and (not Gy.is_nonneg()):
+        # Gy >= 0 is added as an implicit domain constraint if cvxpy cannot verify it
+        self._implicit_nonneg = (not self.bilinear) and (not Gy.is_nonneg())
+        if self._implicit_nonneg:
             warnings.warn(
                 "Gy is non-positive. The y domain of saddle_inner is Gy >="
                 " 0. The implicit constraint Gy >= 0 will be added to the problem."
@@ -106,6 +136,10 @@ class saddle_inner(SaddleAtom):
 
         self.Fx = Fx
         self.Gy = Gy
+        self._Fx_vec = None  # built on first use, inner does not need them
+        self._Gy_vec = None
+        self._convex_vars = tuple(Fx.variables())
+        self._concave_vars = tuple(Gy.variables())
 
         assert len(Fx.shape) <= 1 or (
             len(Fx.shape) == 2 and min(Fx.shape) == 1
@@ -115,24 +149,28 @@ class saddle_inner(SaddleAtom):
         super().__init__(Fx, Gy)
 
     def is_dsp(self) -> bool:
+        if self.bilinear:
+            return True
         x_cvx = self.Fx.is_convex()  # "Fx must be convex"
-        x_nonneg = self.Fx.is_nonneg() or self.bilinear  # "Fx must be non-negative"
+        x_nonneg = self.Fx.is_nonneg()  # "Fx must be non-negative"
         y_ccv = self.Gy.is_concave()  # "Gy must be concave"
-        return all([x_cvx, x_nonneg, y_ccv]) or self.bilinear
+        return x_cvx and x_nonneg and y_ccv
 
     def get_concave_expression(self) -> cp.Expression:
         Fx = self.Fx
         assert Fx.value is not None
         Fx = np_vec(Fx.value, order="F")
-        Gy = cp.vec(self.Gy, order="F")
-        return Fx @ Gy
+        if self._Gy_vec is None:
+            self._Gy_vec = cp.vec(self.Gy, order="F")
+        return Fx @ self._Gy_vec
 
     def get_convex_expression(self) -> cp.Expression:
         Gy = self.Gy
         assert Gy.value is not None
         Gy = np_vec(Gy.value, order="F")
-        Fx = cp.vec(self.Fx, order="F")
-        return Fx @ Gy
+        if self._Fx_vec is None:
+            self._Fx_vec = cp.vec(self.Fx, order="F")
+        return self._Fx_vec @ Gy
 
     def _get_K_repr(self, local_to_glob: LocalToGlob, switched: bool = False) -> KRepresentation:
         if self.bilinear:
@@ -143,7 +181,7 @@ class saddle_inner(SaddleAtom):
             )
         else:
             K_out = K_repr_FxGy(self.Fx, self.Gy, local_to_glob, switched)
-            if not self.Gy.is_nonneg():
+            if self._implicit_nonneg:
                 outer_constraints = K_out.y_constraints if not switched else K_out.constraints
                 outer_constraints.append(self.Gy >= 0)
 
@@ -157,10 +195,10 @@ class saddle_inner(SaddleAtom):
         return np_vec(values[0]) @ np_vec(values[1])
 
     def convex_variables(self) -> list[cp.Variable]:
-        return self.Fx.variables()
+        return list(self._convex_vars)
 
     def concave_variables(self) -> list[cp.Variable]:
-        return self.Gy.variables()
+        return list(self._concave_vars)
 
     def sign_from_args(self) -> tuple[bool, bool]:
         return (True, False)
@@ -181,9 +219,7 @@ class inner(saddle_inner):
         super().__init__(Fx, Gy)
 
     def is_dsp(self) -> bool:
-        x_aff = self.Fx.is_affine()
-        y_aff = self.Gy.is_affine()
-        return x_aff and y_aff
+        return self.bilinear  # both arguments were checked to be affine in __init__
 
     def get_concave_expression(self) -> cp.Expression:
         return self.Fx.value @ self.Gy
@@ -222,7 +258,8 @@ class weighted_log_sum_exp(SaddleAtom):
         assert isinstance(exponents, cp.Expression)
         assert isinstance(weights, cp.Expression)
 
-        if not weights.is_nonneg():
+        self._implicit_nonneg = not weights.is_nonneg()
+        if self._implicit_nonneg:
             warnings.warn(
                 "Weights are non-positive. The domain of weighted log-sum-exp is y >="
                 " 0. The implicit constraint y >= 0 will be added to"
@@ -233,6 +270,10 @@ class weighted_log_sum_exp(SaddleAtom):
 
         self.exponents = exponents
         self.weights = weights
+        self._exponents_vec = cp.vec(exponents, order="F")
+        self._weights_vec = cp.vec(weights, order="F")
+        self._convex_vars = tuple(exponents.variables())
+        self._concave_vars = tuple(weights.variables())
 
         assert len(exponents.shape) <= 1 or (
             len(exponents.shape) == 2 and min(exponents.shape) == 1
@@ -256,8 +297,7 @@ class weighted_log_sum_exp(SaddleAtom):
             return None
 
         x = np_vec(x.value, order="F")
-        y = cp.vec(self.weights, order="F")
-        arg = y @ np.exp(x)
+        arg = self._weights_vec @ np.exp(x)
         return cp.log(arg)
 
     def get_convex_expression(self, eps: float = 1e-6) -> cp.Expression:
@@ -266,10 +306,10 @@ class weighted_log_sum_exp(SaddleAtom):
             return None
 
         x = np_vec(x.value, order="F")
-        y = cp.vec(self.exponents, order="F")
+        y = self._exponents_vec
 
-        nonneg = np.where(x > eps)[0]
-        arg = y[nonneg] + np.log(x)[nonneg]
+        nonneg = np.flatnonzero(x > eps)
+        arg = y[nonneg] + np.log(x[nonneg])
         return cp.log_sum_exp(arg)
 
     def _get_K_repr(self, local_to_glob: LocalToGlob, switched: bool = False) -> KRepresentation:
@@ -280,23 +320,23 @@ class weighted_log_sum_exp(SaddleAtom):
         epi_exp = cp.Variable(self.exponents.size, name="exp_epi")
         constraints = [
             epi_exp >= self.exponents,  # handles composition in exponent
-            ExpCone(cp.reshape(epi_exp + u, (f_local.size,)), np.ones(f_local.size), f_local),
+            ExpCone(epi_exp + u, np.ones(f_local.size), f_local),
             t >= -u - 1,
         ]
 
         t_global = cp.Variable(name="t_global")
         if self.concave_composition:
-            constraints += [t_global == t]
+            constraints.append(t_global == t)
             f_global = cp.Variable(self.weights.size, name="f_global_wlse_comp")
-            constraints += [f_global == f_local]
+            constraints.append(f_global == f_local)
         else:
-            B, c = affine_to_canon(self.weights, local_to_glob, switched)
-            constraints += [t_global == t + f_local @ c]
+            B_T, c = self._affine_to_canon_T(self.weights, local_to_glob, switched)
+            constraints.append(t_global == t + f_local @ c)
             f_global = cp.Variable(
                 local_to_glob.y_size if not switched else local_to_glob.x_size,
                 name="f_global_wlse",
             )
-            constraints += [f_global == B.T @ f_local]
+            constraints.append(f_global == B_T @ f_local)
 
         K_repr = KRepresentation(
             f=f_global,
@@ -304,7 +344,7 @@ class weighted_log_sum_exp(SaddleAtom):
             constraints=constraints,
         )
 
-        switching_variables = self.exponents.variables()  # if not self.concave_composition else [z]
+        switching_variables = self.convex_variables()  # if not self.concave_composition else [z]
         precomp = (
             cp.Variable(self.weights.size, name="z_wlse") if self.concave_composition else None
         )
@@ -323,16 +363,17 @@ class weighted_log_sum_exp(SaddleAtom):
 
         if self.concave_composition:
             if not switched:
-                x_vars_1 = self.convex_variables()
+                # The two switches cannot be merged into one: the second one dualizes the
+                # representation produced by the first, including the precomp constraint.
                 K_switch_1 = switch_convex_concave(
                     K_out.constraints,
                     K_out.f,
                     K_out.t,
-                    x_vars_1,
+                    switching_variables,
                     local_to_glob,
                     precomp=precomp,
                 )
-                K_switch_1.constraints += [self.weights >= precomp]
+                K_switch_1.constraints.append(self.weights >= precomp)
 
                 # dualize the outer concave exp variables if switched
                 x_vars_2 = self.concave_variables()
@@ -345,13 +386,13 @@ class weighted_log_sum_exp(SaddleAtom):
                 )
 
             else:
-                K_out.constraints += [precomp <= self.weights]
+                K_out.constraints.append(precomp <= self.weights)
 
-        if not self.weights.is_nonneg():
+        if self._implicit_nonneg:
             if switched:
-                K_out.constraints += [self.weights >= 0]
+                K_out.constraints.append(self.weights >= 0)
             else:
-                K_out.y_constraints += [self.weights >= 0]
+                K_out.y_constraints.append(self.weights >= 0)
 
         concave_fun = (
             (lambda x: self.get_concave_expression())
@@ -367,10 +408,10 @@ class weighted_log_sum_exp(SaddleAtom):
         return K_out
 
     def convex_variables(self) -> list[cp.Variable]:
-        return self.exponents.variables()
+        return list(self._convex_vars)
 
     def concave_variables(self) -> list[cp.Variable]:
-        return self.weights.variables()
+        return list(self._concave_vars)
 
     def is_incr(self, idx: int) -> bool:
         return True  # increasing in both arguments since y nonneg
@@ -385,6 +426,9 @@ class saddle_quad_form(SaddleAtom):
 
         self.x = x
         self.P = P
+        self._convex_vars = tuple(x.variables())
+        self._concave_vars = tuple(P.variables())
+        self._name = None
 
         super().__init__(x, P)
 
@@ -423,12 +467,12 @@ class saddle_quad_form(SaddleAtom):
             t == 0,
         ]
 
-        B, c = affine_to_canon(self.P, local_to_glob, switched)
+        B_T, c = self._affine_to_canon_T(self.P, local_to_glob, switched)
         F_global = cp.Variable(
             local_to_glob.y_size if not switched else local_to_glob.x_size,
             name="f_global_saddle_quad_form",
         )
-        constraints += [F_global == B.T @ cp.vec(F_local)]
+        constraints.append(F_global == B_T @ cp.vec(F_local, order="F"))
 
         K_repr = KRepresentation(
             f=F_global,
@@ -446,13 +490,15 @@ class saddle_quad_form(SaddleAtom):
         return K_repr
 
     def name(self) -> str:
-        return "saddle_quad_form(" + self.x.name() + ", " + self.P.name() + ")"
+        if self._name is None:
+            self._name = f"saddle_quad_form({self.x.name()}, {self.P.name()})"
+        return self._name
 
     def convex_variables(self) -> list[cp.Variable]:
-        return self.x.variables()
+        return list(self._convex_vars)
 
     def concave_variables(self) -> list[cp.Variable]:
-        return self.P.variables()
+        return list(self._concave_vars)
 
     def sign_from_args(self) -> tuple[bool, bool]:
         return (True, False)
@@ -481,6 +527,8 @@ class quasidef_quad_form(SaddleAtom):
         self.P = P
         self.Q = Q
         self.S = S
+        self._convex_vars = tuple(x.variables())
+        self._concave_vars = tuple(y.variables())
 
         super().__init__(x, y)
 
@@ -530,10 +578,10 @@ class quasidef_quad_form(SaddleAtom):
         )
 
     def convex_variables(self) -> list[cp.Variable]:
-        return self.x.variables()
+        return list(self._convex_vars)
 
     def concave_variables(self) -> list[cp.Variable]:
-        return self.y.variables()
+        return list(self._concave_vars)
 
 
 class weighted_norm2(SaddleAtom):
@@ -556,7 +604,8 @@ class weighted_norm2(SaddleAtom):
         assert isinstance(x, cp.Expression)
         assert isinstance(y, cp.Expression)
 
-        if not y.is_nonneg():
+        self._implicit_nonneg = not y.is_nonneg()
+        if self._implicit_nonneg:
             warnings.warn(
                 "Weights are non-positive. The domain of weighted_norm2 is y >="
                 " 0. The implicit constraint y >= 0 will be added to"
@@ -567,6 +616,8 @@ class weighted_norm2(SaddleAtom):
 
         self.x = x
         self.y = y
+        self._convex_vars = tuple(x.variables())
+        self._concave_vars = tuple(y.variables())
 
         assert len(x.shape) == 1 and len(y.shape) == 1
         assert x.shape == y.shape
@@ -601,17 +652,17 @@ class weighted_norm2(SaddleAtom):
 
         t_global = cp.Variable(name="t_global")
         if self.concave_composition:
-            constraints += [t_global == t]
+            constraints.append(t_global == t)
             f_global = cp.Variable(self.y.size, name="f_global_wnorm2_comp")
-            constraints += [f_global == f_local]
+            constraints.append(f_global == f_local)
         else:
-            B, c = affine_to_canon(self.y, local_to_glob, switched)
-            constraints += [t_global == t + f_local @ c]
+            B_T, c = self._affine_to_canon_T(self.y, local_to_glob, switched)
+            constraints.append(t_global == t + f_local @ c)
             f_global = cp.Variable(
                 local_to_glob.y_size if not switched else local_to_glob.x_size,
                 name="f_global_wnorm2",
             )
-            constraints += [f_global == B.T @ f_local]
+            constraints.append(f_global == B_T @ f_local)
 
         K_repr = KRepresentation(
             f=f_global,
@@ -619,7 +670,7 @@ class weighted_norm2(SaddleAtom):
             constraints=constraints,
         )
 
-        switching_variables = self.x.variables()
+        switching_variables = self.convex_variables()
 
         precomp = cp.Variable(self.y.size, name="z_wnorm2") if self.concave_composition else None
         K_out = (
@@ -637,16 +688,17 @@ class weighted_norm2(SaddleAtom):
 
         if self.concave_composition:
             if not switched:
-                x_vars_1 = self.convex_variables()
+                # The two switches cannot be merged into one: the second one dualizes the
+                # representation produced by the first, including the precomp constraint.
                 K_switch_1 = switch_convex_concave(
                     K_out.constraints,
                     K_out.f,
                     K_out.t,
-                    x_vars_1,
+                    switching_variables,
                     local_to_glob,
                     precomp=precomp,
                 )
-                K_switch_1.constraints += [self.y >= precomp]
+                K_switch_1.constraints.append(self.y >= precomp)
 
                 # dualize the outer concave x variables if switched
                 x_vars_2 = self.concave_variables()
@@ -659,13 +711,13 @@ class weighted_norm2(SaddleAtom):
                 )
 
             else:
-                K_out.constraints += [precomp <= self.y]
+                K_out.constraints.append(precomp <= self.y)
 
-        if not self.y.is_nonneg():
+        if self._implicit_nonneg:
             if switched:
-                K_out.constraints += [self.y >= 0]
+                K_out.constraints.append(self.y >= 0)
             else:
-                K_out.y_constraints += [self.y >= 0]
+                K_out.y_constraints.append(self.y >= 0)
 
         concave_fun = (
             (lambda x: self.get_concave_expression())
@@ -695,10 +747,10 @@ class weighted_norm2(SaddleAtom):
         return cp.norm2(cp.multiply(x, np.sqrt(y)))
 
     def convex_variables(self) -> list[cp.Variable]:
-        return self.x.variables()
+        return list(self._convex_vars)
 
     def concave_variables(self) -> list[cp.Variable]:
-        return self.y.variables()
+        return list(self._concave_vars)
 
     def sign_from_args(self) -> tuple[bool, bool]:
         return (True, False)
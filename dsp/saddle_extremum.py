@@ -23,16 +23,18 @@ class SaddleExtremum(Atom):
 
         self.f = f
         self._parser = None
+        self._is_dsp = None
+        self._name = None
 
-        self._validate_arguments(constraints)
+        assert isinstance(constraints, Iterable)
         self.constraints = list(constraints)
+        self._validate_arguments(self.constraints)
         self.other_variables = [v for v in f.variables() if not isinstance(v, dsp.LocalVariable)]
 
         super().__init__(*self.other_variables)
 
     def _validate_arguments(self, constraints: list[cp.Constraint]) -> None:
         assert self.f.size == 1
-        assert isinstance(constraints, Iterable)
         for c in constraints:
             for v in c.variables():
                 if not isinstance(v, dsp.LocalVariable):
@@ -42,11 +44,13 @@ class SaddleExtremum(Atom):
         assert isinstance(self.f, cp.Expression)
 
     def is_dsp(self) -> bool:
-        try:
-            self.parser  # noqa
-            return all([c.is_dcp() for c in self.constraints])
-        except DSPError:
-            return False
+        if self._is_dsp is None:
+            try:
+                self.parser  # noqa
+                self._is_dsp = all(c.is_dcp() for c in self.constraints)
+            except DSPError:
+                self._is_dsp = False
+        return self._is_dsp
 
     def is_incr(self, idx: int) -> bool:
         return False
@@ -83,9 +87,15 @@ class saddle_max(SaddleExtremum):
     ) -> None:
 
         super().__init__(f, constraints)
+        self._local_to_glob_y = None
+        self._K_repr = None
 
-        self._concave_vars = set(filter(lambda v: isinstance(v, dsp.LocalVariable), f.variables()))
-        self._concave_vars |= set(itertools.chain.from_iterable(c.variables() for c in constraints))
+        self._concave_vars = frozenset(
+            itertools.chain(
+                filter(lambda v: isinstance(v, dsp.LocalVariable), f.variables()),
+                itertools.chain.from_iterable(c.variables() for c in self.constraints),
+            )
+        )
 
         for v in self._concave_vars:
             v.expr = self
@@ -108,7 +118,7 @@ class saddle_max(SaddleExtremum):
             )
 
             assert set(self.other_variables) == parser.convex_vars
-            assert set(self._concave_vars) == parser.concave_vars
+            assert self._concave_vars == parser.concave_vars
 
             for v in self._concave_vars:
                 v.expr = self
@@ -119,16 +129,29 @@ class saddle_max(SaddleExtremum):
             return self._parser
 
     def name(self) -> str:
-        return f"saddle_max({self.f.name()}, [{''.join([str(c) for c in self.constraints])}])"
+        if self._name is None:
+            constraints = "".join(str(c) for c in self.constraints)
+            self._name = f"saddle_max({self.f.name()}, [{constraints}])"
+        return self._name
 
     def numeric(self, values: list) -> np.ndarray | None:
         r"""
         Compute sup_{y\in Y}f(x,y) numerically
         """
 
-        local_to_glob_y = LocalToGlob(self.convex_variables(), self.concave_variables())
-
-        K_repr = self.parser.parse_expr_repr(self.f, switched=False, local_to_glob=local_to_glob_y)
+        K_repr = self._K_repr
+        if K_repr is None:
+            # the variable layout does not depend on parameter values, so it is always reused
+            if self._local_to_glob_y is None:
+                self._local_to_glob_y = LocalToGlob(
+                    self.convex_variables(), self.concave_variables()
+                )
+            K_repr = self.parser.parse_expr_repr(
+                self.f, switched=False, local_to_glob=self._local_to_glob_y
+            )
+            # parsing reads parameter values, so the result is only reusable without parameters
+            if not self.f.parameters():
+                self._K_repr = K_repr
 
         ccv = K_repr.concave_expr(values)
         if ccv is None:
@@ -157,9 +180,17 @@ class saddle_min(SaddleExtremum):
     ) -> None:
 
         super().__init__(f, constraints)
-
-        self._convex_vars = set(filter(lambda v: isinstance(v, dsp.LocalVariable), f.variables()))
-        self._convex_vars |= set(itertools.chain.from_iterable(c.variables() for c in constraints))
+        self._neg_f = -f
+        self._neg_parser = None
+        self._neg_local_to_glob = None
+        self._neg_K_repr = None
+
+        self._convex_vars = frozenset(
+            itertools.chain(
+                filter(lambda v: isinstance(v, dsp.LocalVariable), f.variables()),
+                itertools.chain.from_iterable(c.variables() for c in self.constraints),
+            )
+        )
 
         for v in self._convex_vars:
             v.expr = self
@@ -180,7 +211,7 @@ class saddle_min(SaddleExtremum):
                 constraints=self.constraints,
             )
 
-            assert set(self._convex_vars) == parser.convex_vars
+            assert self._convex_vars == parser.convex_vars
             assert set(self.other_variables) == parser.concave_vars
 
             for v in self._convex_vars:
@@ -192,22 +223,34 @@ class saddle_min(SaddleExtremum):
             return self._parser
 
     def name(self) -> str:
-        return f"saddle_min({self.f.name()}, [{''.join([str(c) for c in self.constraints])}])"
+        if self._name is None:
+            constraints = "".join(str(c) for c in self.constraints)
+            self._name = f"saddle_min({self.f.name()}, [{constraints}])"
+        return self._name
 
     def numeric(self, values: list) -> np.ndarray | None:
         r"""
         Compute inf_{x\in X}f(x,y) numerically via -sup_{x\in X}-f(x,y)
         """
-        neg_parser = initialize_parser(
-            -self.f,
-            minimization_vars=self.concave_variables(),
-            maximization_vars=self.convex_variables(),
-            constraints=self.constraints,
-        )
-        neg_local_to_glob = LocalToGlob(neg_parser.convex_vars, neg_parser.concave_vars)
-        neg_K_repr = neg_parser.parse_expr_repr(
-            -self.f, switched=False, local_to_glob=neg_local_to_glob
-        )
+        neg_K_repr = self._neg_K_repr
+        if neg_K_repr is None:
+            # the parser and variable layout of -f do not depend on parameter values
+            if self._neg_parser is None:
+                self._neg_parser = initialize_parser(
+                    self._neg_f,
+                    minimization_vars=self.concave_variables(),
+                    maximization_vars=self.convex_variables(),
+                    constraints=self.constraints,
+                )
+                self._neg_local_to_glob = LocalToGlob(
+                    self._neg_parser.convex_vars, self._neg_parser.concave_vars
+                )
+            neg_K_repr = self._neg_parser.parse_expr_repr(
+                self._neg_f, switched=False, local_to_glob=self._neg_local_to_glob
+            )
+            # parsing reads parameter values, so the result is only reusable without parameters
+            if not self.f.parameters():
+                self._neg_K_repr = neg_K_repr
 
         ccv = neg_K_repr.concave_expr(values)
         if ccv is None:
@@ -5,6 +5,6 @@ import numpy as np
 
 def np_vec(x: float | np.ndarray, order: str = "F") -> np.ndarray:
     """
-    Convert a **scalar** or ndarray to a 1D array.
+    Convert a **scalar** or ndarray to a 1D array. Returns a view where possible.
     """
-    return np.atleast_1d(x).flatten(order=order)
+    return np.atleast_1d(x).ravel(order=order)
@@ -309,3 +309,50 @@ def test_canon_non_dsp():
 
     with pytest.raises(DSPError):
         saddle_min_canon(f, None)
+
+
+def test_repeated_numeric():
+    x = cp.Variable(2, name="x", nonneg=True)
+    y_local = LocalVariable(2, name="y_local", nonneg=True)
+    sup_y_f = saddle_max(inner(x, y_local), [cp.sum(y_local) == 1])
+
+    x.value = np.array([1.0, 2.0])
+    assert np.isclose(sup_y_f.numeric(None), 2, atol=1e-4)
+    x.value = np.array([3.0, 2.0])
+    assert np.isclose(sup_y_f.numeric(None), 3, atol=1e-4)
+
+    y = cp.Variable(2, name="y", nonneg=True)
+    x_local = LocalVariable(2, name="x_local", nonneg=True)
+    inf_x_f = saddle_min(inner(x_local, y), [cp.sum(x_local) == 1])
+
+    y.value = np.array([1.0, 2.0])
+    assert np.isclose(inf_x_f.numeric(None), 1, atol=1e-4)
+    y.value = np.array([3.0, 2.0])
+    assert np.isclose(inf_x_f.numeric(None), 2, atol=1e-4)
+
+    # parameter values are read anew on every evaluation
+    p = cp.Parameter()
+    y_local = LocalVariable(2, name="y_local", nonneg=True)
+    sup_y_g = saddle_max(inner(x, y_local) + p, [cp.sum(y_local) == 1])
+    x.value = np.array([1.0, 2.0])
+    p.value = 0
+    assert np.isclose(sup_y_g.numeric(None), 2, atol=1e-4)
+    p.value = 10
+    assert np.isclose(sup_y_g.numeric(None), 12, atol=1e-4)
+
+    x_local = LocalVariable(2, name="x_local", nonneg=True)
+    inf_x_g = saddle_min(inner(x_local, y) + p, [cp.sum(x_local) == 1])
+    y.value = np.array([1.0, 2.0])
+    p.value = 0
+    assert np.isclose(inf_x_g.numeric(None), 1, atol=1e-4)
+    p.value = 10
+    assert np.isclose(inf_x_g.numeric(None), 11, atol=1e-4)
+
+
+def test_generator_constraints():
+    x = cp.Variable(2, name="x", nonneg=True)
+    y_local = LocalVariable(2, name="y_local", nonneg=True)
+    sup_y_f = saddle_max(inner(x, y_local), (c for c in [cp.sum(y_local) == 1]))
+
+    assert len(sup_y_f.constraints) == 1
+    assert sup_y_f.is_dsp()
@@ -342,3 +342,45 @@ def test_wsle_value():
     y.value = np.arange(n)
 
     assert wlse.value == np.log(np.sum(y.value * np.exp(x.value)))
+
+
+def test_wlse_affine_canon_cache():
+    x = cp.Variable(2, name="x")
+    y = cp.Variable(2, name="y", nonneg=True)
+    wlse = weighted_log_sum_exp(x, y)
+
+    B_T, c = wlse._affine_to_canon_T(y, LocalToGlob([x], [y]), switched=False)
+
+    # a new LocalToGlob with the same layout reuses the cached entry
+    B_T_2, c_2 = wlse._affine_to_canon_T(y, LocalToGlob([x], [y]), switched=False)
+    assert B_T_2 is B_T and c_2 is c
+    assert len(wlse._affine_canon_cache) == 1
+
+    # the switched side of a swapped layout has the same columns
+    B_T_3, _ = wlse._affine_to_canon_T(y, LocalToGlob([y], [x]), switched=True)
+    assert B_T_3 is B_T
+    assert len(wlse._affine_canon_cache) == 1
+
+    # a different layout gets its own entry
+    z = cp.Variable(3, name="z")
+    B_T_4, _ = wlse._affine_to_canon_T(y, LocalToGlob([x], [z, y]), switched=False)
+    assert B_T_4.shape == (5, 2)
+    assert len(wlse._affine_canon_cache) == 2
+
+
+def test_wlse_affine_canon_parameter():
+    x = cp.Variable(2, name="x")
+    y = cp.Variable(2, name="y", nonneg=True)
+    p = cp.Parameter(2, nonneg=True)
+    wlse = weighted_log_sum_exp(x, cp.multiply(p, y))
+
+    p.value = np.ones(2)
+    prob = SaddlePointProblem(MinimizeMaximize(wlse), [x >= 0, cp.sum(y) == 1])
+    prob.solve()
+    assert np.isclose(prob.value, 0, atol=1e-4)
+
+    # changing the parameter must be reflected in newly built problems
+    p.value = 3 * np.ones(2)
+    prob = SaddlePointProblem(MinimizeMaximize(wlse), [x >= 0, cp.sum(y) == 1])
+    prob.solve()
+    assert np.isclose(prob.value, np.log(3), atol=1e-4)